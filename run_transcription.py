@@ -9,13 +9,21 @@ def main():
                         help='Path to JSON file containing video URLs or comma-separated list of URLs')
     parser.add_argument('--output', '-o', type=str, default='transcripts.pdf', 
                         help='Output PDF file path')
-    parser.add_argument('--model', '-m', type=str, default='base', 
-                        choices=['tiny', 'base', 'small', 'medium', 'large'],
-                        help='Whisper model size to use')
+    parser.add_argument('--model', '-m', type=str, default=None, 
+                        choices=['tiny', 'base', 'small', 'medium', 'large', 'distil-large-v3', 'large-v3-turbo'],
+                        help='Whisper model to use (default: distil-large-v3 on GPU, base on CPU; '
+                             'distil-large-v3 is English-only, use large-v3-turbo for other languages)')
     parser.add_argument('--max-downloads', '-d', type=int, default=10, 
                         help='Maximum concurrent downloads')
+    parser.add_argument('--max-downloads-per-host', type=int, default=3, 
+                        help='Maximum concurrent downloads from a single site')
     parser.add_argument('--max-transcriptions', '-t', type=int, default=4, 
-                        help='Maximum concurrent transcription processes')
+                        help='Maximum concurrent transcription jobs')
+    parser.add_argument('--batch-size', '-b', type=int, default=16, 
+                        help='Audio chunks decoded together per transcription (lower if GPU memory is limited)')
+    parser.add_argument('--device', type=str, default='auto', 
+                        choices=['auto', 'cuda', 'cpu'],
+                        help='Device to run Whisper on (auto uses a GPU when available)')
     
     args = parser.parse_args()
     
@@ -50,7 +58,10 @@ def main():
     # Initialize and run the pipeline
     pipeline = VideoTranscriptionPipeline(
         max_concurrent_downloads=args.max_downloads,
-        max_concurrent_transcriptions=args.max_transcriptions
+        max_concurrent_transcriptions=args.max_transcriptions,
+        max_downloads_per_host=args.max_downloads_per_host,
+        batch_size=args.batch_size,
+        device=args.device
     )
     
     result = pipeline.process_videos(
@@ -5,7 +5,9 @@ import logging
 import time
 import concurrent.futures
 from pathlib import Path
-import whisper
+from xml.sax.saxutils import escape
+import ctranslate2
+from faster_whisper import WhisperModel
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, PageBreak, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -36,6 +38,7 @@ class VideoTranscriptionPipeline:
         self.max_concurrent_transcriptions = max_concurrent_transcriptions
         self.audio_format = audio_format
         self.temp_dir = None
+        self._temp = None
         self.whisper_model = None
         self.results = []
         self.errors = []
@@ -44,8 +47,17 @@ class VideoTranscriptionPipeline:
         """Initialize resources including the Whisper model"""
         logger.info(f"Initializing pipeline with Whisper model: {model_name}")
         try:
-            self.whisper_model = whisper.load_model(model_name)
-            logger.info("Whisper model loaded successfully")
+            # CTranslate2 backend with INT8 weights (FP16 activations on GPU)
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+            compute_type = "int8_float16" if device == "cuda" else "int8"
+            # One CTranslate2 worker per transcription thread, otherwise concurrent calls queue up
+            self.whisper_model = WhisperModel(
+                model_name,
+                device=device,
+                compute_type=compute_type,
+                num_workers=self.max_concurrent_transcriptions,
+            )
+            logger.info(f"Whisper model loaded successfully on {device} ({compute_type})")
         except Exception as e:
             logger.error(f"Failed to load Whisper model: {str(e)}")
             raise
@@ -64,17 +76,19 @@ class VideoTranscriptionPipeline:
 
         # Generate a filename-friendly ID
         video_id = video_url.split("/")[-1] if "/" in video_url else video_url
-        audio_file = os.path.join(self.temp_dir, f"{video_id}.{self.audio_format}")
+        audio_file = self._temp / f"{video_id}.{self.audio_format}"
 
         try:
-            # Use yt-dlp to download and extract audio
+            # Use yt-dlp to download and extract audio, resampled to Whisper's native 16 kHz mono
             cmd = [
                 "yt-dlp",
                 "--extract-audio",
                 "--audio-format",
                 self.audio_format,
+                "--postprocessor-args",
+                "ffmpeg:-ar 16000 -ac 1",
                 "--output",
-                os.path.join(self.temp_dir, "%(id)s.%(ext)s"),
+                str(self._temp / "%(id)s.%(ext)s"),
                 video_url,
             ]
 
@@ -87,7 +101,7 @@ class VideoTranscriptionPipeline:
                 check=True,
             )
 
-            if os.path.exists(audio_file):
+            if audio_file.is_file():
                 logger.info(f"Successfully downloaded and extracted audio for {video_url}")
                 return audio_file
             else:
@@ -117,10 +131,10 @@ class VideoTranscriptionPipeline:
 
         try:
             # Perform transcription
-            result = self.whisper_model.transcribe(audio_file)
+            segments, info = self.whisper_model.transcribe(str(audio_file), beam_size=1, vad_filter=True)
 
-            # Get the transcript text
-            transcript = result.get("text", "").strip()
+            # Get the transcript text (segments are generated lazily)
+            transcript = " ".join(segment.text.strip() for segment in segments).strip()
 
             if transcript:
                 logger.info(f"Successfully transcribed audio from {video_url}")
@@ -133,12 +147,13 @@ class VideoTranscriptionPipeline:
             logger.error(f"Failed to transcribe {audio_file} from {video_url}: {str(e)}")
             return {"url": video_url, "status": "error", "error_message": str(e)}
         finally:
-            # Clean up audio file
+            # Clean up audio file (unlink directly rather than check-then-remove)
             try:
-                if os.path.exists(audio_file):
-                    os.remove(audio_file)
-                    logger.info(f"Removed temporary audio file: {audio_file}")
-            except Exception as e:
+                os.unlink(audio_file)
+                logger.info(f"Removed temporary audio file: {audio_file}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
                 logger.warning(f"Failed to delete temporary audio file {audio_file}: {str(e)}")
 
     def generate_pdf(self, output_path="transcripts.pdf"):
@@ -160,14 +175,14 @@ class VideoTranscriptionPipeline:
                 content.append(PageBreak())
 
             # Video Header
-            content.append(Paragraph(f"Video {idx}: {result['url']}", styles["Heading2"]))
+            content.append(Paragraph(f"Video {idx}: {escape(result['url'])}", styles["Heading2"]))
             content.append(Spacer(1, 12))
 
             # Transcript or error
             if result["status"] == "success":
-                content.append(Paragraph(result["transcript"], styles["Normal"]))
+                content.append(Paragraph(escape(result["transcript"]).replace("\n", "<br/>"), styles["Normal"]))
             else:
-                content.append(Paragraph(f"Error: {result.get('error_message', 'Unknown error')}", styles["Normal"]))
+                content.append(Paragraph(f"Error: {escape(result.get('error_message', 'Unknown error'))}", styles["Normal"]))
 
         doc.build(content)
         logger.info(f"PDF report successfully generated at {output_path}")
@@ -184,6 +199,7 @@ class VideoTranscriptionPipeline:
 
         with tempfile.TemporaryDirectory() as temp_dir:
             self.temp_dir = temp_dir
+            self._temp = Path(temp_dir)
             logger.info(f"Temporary directory created: {temp_dir}")
 
             self.initialize(whisper_model_name)
@@ -192,7 +208,7 @@ class VideoTranscriptionPipeline:
             with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrent_downloads) as download_executor:
                 download_futures = {download_executor.submit(self.download_and_extract_audio, url): url for url in video_urls}
 
-                with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_concurrent_transcriptions) as transcribe_executor:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrent_transcriptions) as transcribe_executor:
                     transcribe_futures = []
 
                     for future in concurrent.futures.as_completed(download_futures):
@@ -1,11 +1,23 @@
 import os
+import re
+import json
+import hashlib
 import subprocess
 import tempfile
 import logging
+import threading
 import time
+import queue
 import concurrent.futures
+from collections import deque
 from pathlib import Path
-import whisper
+from urllib.parse import urlparse
+from xml.sax.saxutils import escape
+import ctranslate2
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from yt_dlp import YoutubeDL
+from yt_dlp.utils import DownloadError
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, PageBreak, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -19,101 +31,359 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Whisper's native input sample rate; audio is decoded to this rate, mono, float32
+SAMPLE_RATE = 16000
+
+# Silero VAD settings: only split speech on pauses of at least 500 ms and pad each
+# region by 500 ms into the surrounding silence (regions never overlap). The batched
+# pipeline merges regions into chunks of at most its default 30 s chunk length
+VAD_PARAMETERS = {
+    "min_silence_duration_ms": 500,
+    "speech_pad_ms": 500
+}
+
+# How long queue waits block before re-checking whether the pipeline was interrupted
+QUEUE_POLL_SECONDS = 0.5
+
+# How often and how long to back off when a host rate-limits a download
+DOWNLOAD_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 2
+RATE_LIMIT_PATTERN = re.compile(r"\b429\b|too many requests|rate.?limit", re.I)
+
+# Transcript post-processing: n-gram sizes checked for Whisper's looping failure
+# mode, how many back-to-back repeats are tolerated, and boilerplate lines the
+# model hallucinates from its YouTube pretraining data (matched against whole segments)
+REPEAT_NGRAM_SIZES = range(7, 3, -1)
+MAX_NGRAM_REPEATS = 3
+BLACKLIST = [
+    r"thanks? (you )?(so much )?for watching[.!]?",
+    r"please (like and )?subscribe( to (my|our|the) channel)?[.!]?",
+    r"don't forget to (like and )?subscribe[.!]?",
+    r"subtitles by the amara\.org community[.!]?",
+    r"transcribed by https?://otter\.ai[.!]?",
+]
+BLACKLIST_PATTERN = re.compile("|".join(BLACKLIST), re.I)
+
 class VideoTranscriptionPipeline:
-    def __init__(self, max_concurrent_downloads=10, max_concurrent_transcriptions=4):
+    def __init__(self, max_concurrent_downloads=10, max_concurrent_transcriptions=4, batch_size=16, device="auto",
+                 cache_dir=None, max_downloads_per_host=3):
         """
         Initialize the video transcription pipeline.
         
         Args:
             max_concurrent_downloads: Maximum number of concurrent video downloads
             max_concurrent_transcriptions: Maximum number of concurrent transcription jobs
+            batch_size: Number of audio chunks decoded together per transcription (lower it if VRAM is tight)
+            device: Device to run Whisper on ("cuda", "cpu", or "auto" to use a GPU when one is available)
+            cache_dir: Directory for cached transcripts (defaults to $TRANSCRIBINATOR_CACHE or ~/.cache/transcribinator)
+            max_downloads_per_host: Maximum number of concurrent downloads from any single host
         """
         self.max_concurrent_downloads = max_concurrent_downloads
         self.max_concurrent_transcriptions = max_concurrent_transcriptions
+        self.max_downloads_per_host = max_downloads_per_host
+        self.batch_size = batch_size
+        self.device = device
+        self.cache_dir = Path(
+            cache_dir or os.environ.get("TRANSCRIBINATOR_CACHE", "~/.cache/transcribinator")
+        ).expanduser()
         self.temp_dir = None
+        self._temp = None
         self.whisper_model = None
+        self.batched_model = None
+        self._downloaders = threading.local()
         self.results = []
         self.errors = []
+        
+        # PDF styles, built once and shared by every report
+        self._styles = getSampleStyleSheet()
+        
+        self._title_style = ParagraphStyle(
+            'TitleStyle',
+            parent=self._styles['Heading1'],
+            fontSize=18,
+            spaceAfter=12
+        )
+        
+        self._url_style = ParagraphStyle(
+            'URLStyle',
+            parent=self._styles['Heading2'],
+            fontSize=12,
+            textColor=colors.blue,
+            spaceAfter=6
+        )
+        
+        self._transcript_style = ParagraphStyle(
+            'TranscriptStyle',
+            parent=self._styles['Normal'],
+            fontSize=10,
+            spaceAfter=12
+        )
+        
+        self._error_style = ParagraphStyle(
+            'ErrorStyle',
+            parent=self._styles['Normal'],
+            textColor=colors.red,
+            fontSize=10
+        )
+        
+        # PDF flowables, filled in as transcriptions complete
+        self._content = []
+        self._report_count = 0
+        
+        # Guards results, errors and the PDF flowables, which transcription threads update
+        self._results_lock = threading.Lock()
     
-    def initialize(self, model_name="base"):
-        """Initialize resources including the Whisper model"""
+    def initialize(self, model_name=None):
+        """Initialize resources including the Whisper model (model_name defaults per device, see _default_model_name)"""
+        model_name = model_name or self._default_model_name()
         logger.info(f"Initializing pipeline with Whisper model: {model_name}")
         try:
-            self.whisper_model = whisper.load_model(model_name)
-            logger.info("Whisper model loaded successfully")
+            # CTranslate2 backend with INT8 weights (FP16 activations on GPU)
+            device = self._resolve_device()
+            compute_type = "int8_float16" if device == "cuda" else "int8"
+            
+            # CTranslate2 runs one transcribe call per worker at a time, so load enough
+            # workers (model replicas) for every transcription thread, spread across all
+            # visible GPUs; on CPU the cores are split between the workers
+            device_index = 0
+            num_workers = self.max_concurrent_transcriptions
+            cpu_threads = 0
+            if device == "cuda":
+                device_index = list(range(ctranslate2.get_cuda_device_count()))
+                if self.max_concurrent_transcriptions < len(device_index):
+                    logger.warning(
+                        f"Only {self.max_concurrent_transcriptions} concurrent transcriptions for "
+                        f"{len(device_index)} GPUs, some GPUs will stay idle"
+                    )
+                # num_workers is per device
+                num_workers = -(-self.max_concurrent_transcriptions // len(device_index))
+            else:
+                cpu_threads = max(1, (os.cpu_count() or 1) // num_workers)
+            
+            self.whisper_model = WhisperModel(
+                model_name,
+                device=device,
+                device_index=device_index,
+                compute_type=compute_type,
+                num_workers=num_workers,
+                cpu_threads=cpu_threads
+            )
+            self.batched_model = BatchedInferencePipeline(self.whisper_model)
+            replicas = num_workers * (len(device_index) if device == "cuda" else 1)
+            logger.info(f"Whisper model loaded successfully on {device} ({compute_type}, {replicas} worker(s))")
         except Exception as e:
             logger.error(f"Failed to load Whisper model: {str(e)}")
             raise
+        
+        # Downloaders are bound to the current temp directory, so start fresh each run
+        self._downloaders = threading.local()
+        
+        self._warm_up(replicas)
+    
+    def _warm_up(self, replicas):
+        """
+        Transcribe a second of silence on every model worker so CUDA context setup and
+        kernel selection happen here rather than on the first real videos
+        
+        Args:
+            replicas: Number of CTranslate2 workers across all devices
+        """
+        start = time.perf_counter()
+        try:
+            # CTranslate2 hands concurrent calls to idle workers, so one simultaneous
+            # call per worker reaches each replica (including those on other GPUs)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=replicas) as warm_up_executor:
+                futures = [warm_up_executor.submit(self._warm_up_worker) for _ in range(replicas)]
+                for future in futures:
+                    future.result()
+            logger.info(
+                f"Whisper warm-up of {replicas} worker(s) completed in {time.perf_counter() - start:.2f} seconds"
+            )
+        except Exception as e:
+            logger.warning(f"Whisper warm-up failed, first transcriptions may be slower: {str(e)}")
+    
+    def _warm_up_worker(self):
+        """Run a single warm-up transcription on one second of silence"""
+        # VAD would drop pure silence before it reaches the model, so disable it here
+        segments, info = self.batched_model.transcribe(
+            np.zeros(SAMPLE_RATE, dtype=np.float32),
+            batch_size=1,
+            beam_size=1,
+            vad_filter=False
+        )
+        # Segments are generated lazily; consume them to run the decoder
+        list(segments)
+    
+    def _default_model_name(self):
+        """
+        Pick the default Whisper model for the configured device
+        
+        distil-large-v3 is fast on a GPU but has ~10x the parameters of base and is
+        English-only, so CPU runs default to base instead.
+        """
+        on_gpu = self.device == "cuda" or (self.device == "auto" and ctranslate2.get_cuda_device_count() > 0)
+        return "distil-large-v3" if on_gpu else "base"
+    
+    def _resolve_device(self):
+        """Pick the device for Whisper, logging it so a silent CPU fallback is visible"""
+        gpu_count = ctranslate2.get_cuda_device_count()
+        
+        if self.device == "auto":
+            device = "cuda" if gpu_count > 0 else "cpu"
+        elif self.device == "cuda" and gpu_count == 0:
+            raise RuntimeError("CUDA device requested but no CUDA GPU is visible to CTranslate2")
+        else:
+            device = self.device
+        
+        if device == "cuda":
+            logger.info(f"Using CUDA for transcription ({gpu_count} GPU(s) visible)")
+        elif gpu_count > 0:
+            logger.info(f"Using CPU for transcription although {gpu_count} GPU(s) are visible")
+        else:
+            logger.warning("No CUDA GPU detected, transcription will run on CPU and be much slower")
+        
+        return device
     
     def download_and_extract_audio(self, video_url):
         """
-        Download video and extract audio using yt-dlp
+        Download video audio using yt-dlp and decode it in memory with ffmpeg
         
         Args:
             video_url: URL of the video to download
             
         Returns:
-            Path to the extracted audio file or None if failed
+            16 kHz mono float32 numpy array with the audio samples or None if failed
         """
         logger.info(f"Starting download and audio extraction for {video_url}")
         
-        # Create a unique filename based on the video URL
-        video_id = video_url.split('/')[-1] if '/' in video_url else video_url
-        audio_file = os.path.join(self.temp_dir, f"{video_id}.wav")
-        
+        source_file = None
         try:
-            # Use yt-dlp to download and extract audio in one step
+            # Download the best audio stream as-is with this thread's reusable downloader
+            ydl = self._get_downloader()
+            info = self._extract_with_backoff(ydl, video_url)
+            source_file = Path(ydl.prepare_filename(info))
+            
+            if not source_file.is_file():
+                logger.error(f"Download completed but file not found for {video_url}")
+                return None
+            
+            # Decode straight to Whisper's input format on ffmpeg's stdout, skipping a WAV temp file
             cmd = [
-                "yt-dlp",
-                "--extract-audio",
-                "--audio-format", "wav",
-                "--output", audio_file,
-                video_url
+                "ffmpeg",
+                "-nostdin",
+                "-loglevel", "error",
+                "-i", str(source_file),
+                "-f", "f32le",
+                "-ac", "1",
+                "-ar", str(SAMPLE_RATE),
+                "pipe:1"
             ]
-            
-            # Run the command and capture output
             process = subprocess.run(
-                cmd, 
-                stdout=subprocess.PIPE, 
+                cmd,
+                stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
                 check=True
             )
+            audio = np.frombuffer(process.stdout, dtype=np.float32)
             
-            if os.path.exists(audio_file):
+            if audio.size:
                 logger.info(f"Successfully downloaded and extracted audio for {video_url}")
-                return audio_file
+                return audio
             else:
-                logger.error(f"Audio extraction completed but file not found for {video_url}")
+                logger.error(f"Audio extraction completed but no samples decoded for {video_url}")
                 return None
                 
+        except DownloadError as e:
+            logger.error(f"Failed to download audio from {video_url}: {str(e)}")
+            return None
         except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to download or extract audio from {video_url}: {str(e)}")
-            logger.error(f"Error output: {e.stderr}")
+            logger.error(f"Failed to extract audio from {video_url}: {str(e)}")
+            logger.error(f"Error output: {e.stderr.decode(errors='replace')}")
             return None
         except Exception as e:
             logger.error(f"Unexpected error processing {video_url}: {str(e)}")
             return None
+        finally:
+            # Clean up the downloaded source file (unlink directly rather than check-then-remove)
+            if source_file is not None:
+                try:
+                    os.unlink(source_file)
+                    logger.info(f"Removed temporary download: {source_file}")
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"Failed to delete temporary download {source_file}: {str(e)}")
+    
+    def _extract_with_backoff(self, ydl, video_url):
+        """
+        Download a video, retrying with exponential backoff when the host rate-limits us
+        
+        Args:
+            ydl: YoutubeDL instance to download with
+            video_url: URL of the video to download
+            
+        Returns:
+            yt-dlp info dictionary for the downloaded video
+        """
+        for attempt in range(DOWNLOAD_RETRIES + 1):
+            try:
+                return ydl.extract_info(video_url, download=True)
+            except DownloadError as e:
+                if attempt == DOWNLOAD_RETRIES or not RATE_LIMIT_PATTERN.search(str(e)):
+                    raise
+                delay = RETRY_BACKOFF_SECONDS * 2 ** attempt
+                logger.warning(f"Rate limited while downloading {video_url}, retrying in {delay}s")
+                time.sleep(delay)
+    
+    def _get_downloader(self):
+        """
+        Return the YoutubeDL instance for the calling thread, creating it on first use
+        
+        YoutubeDL is not thread-safe, so each download thread keeps its own instance
+        and reuses it for every URL it handles instead of spawning a yt-dlp process per URL.
+        """
+        ydl = getattr(self._downloaders, "ydl", None)
+        if ydl is None:
+            ydl = YoutubeDL({
+                "format": "bestaudio/best",
+                "outtmpl": str(self._temp / "%(id)s.%(ext)s"),
+                "quiet": True,
+                "noprogress": True,
+                "logger": logger
+            })
+            self._downloaders.ydl = ydl
+        return ydl
     
-    def transcribe_audio(self, audio_file, video_url):
+    def transcribe_audio(self, audio, video_url):
         """
-        Transcribe audio file using Whisper
+        Transcribe decoded audio using Whisper
         
         Args:
-            audio_file: Path to the WAV audio file
+            audio: 16 kHz mono float32 numpy array of audio samples
             video_url: Original video URL (for reference)
             
         Returns:
             Dictionary with transcription results or error info
         """
-        logger.info(f"Starting transcription for {audio_file} from {video_url}")
+        duration = audio.size / SAMPLE_RATE
+        logger.info(f"Starting transcription of {duration:.1f}s of audio from {video_url}")
         
         try:
-            # Perform transcription using Whisper
-            result = self.whisper_model.transcribe(audio_file)
+            # Perform transcription using Whisper, decoding the VAD chunks of the clip in batches
+            segments, info = self.batched_model.transcribe(
+                audio,
+                batch_size=self.batch_size,
+                beam_size=1,
+                vad_filter=True,
+                vad_parameters=dict(VAD_PARAMETERS),
+                word_timestamps=False
+            )
             
-            # Get the transcript text
-            transcript = result.get("text", "").strip()
+            # Get the transcript text (segments are generated lazily), dropping segments
+            # that consist entirely of hallucinated boilerplate
+            texts = (segment.text.strip() for segment in segments)
+            transcript = " ".join(text for text in texts if text and not BLACKLIST_PATTERN.fullmatch(text))
+            transcript = self._postprocess(transcript)
             
             if transcript:
                 logger.info(f"Successfully transcribed audio from {video_url}")
@@ -131,25 +401,272 @@ class VideoTranscriptionPipeline:
                 }
                 
         except Exception as e:
-            logger.error(f"Failed to transcribe {audio_file} from {video_url}: {str(e)}")
+            logger.error(f"Failed to transcribe audio from {video_url}: {str(e)}")
             return {
                 "url": video_url,
                 "status": "error",
                 "error_message": str(e)
             }
+    
+    def _host_download_jobs(self, video_urls):
+        """
+        Split URLs into per-host work queues for the download pool
+        
+        Each host gets a deque of its URLs and at most max_downloads_per_host workers
+        draining it. Jobs are ordered round-robin across hosts, so every host starts
+        downloading early and no pool thread waits on a host that is already busy.
+        
+        Args:
+            video_urls: URLs to download
+            
+        Returns:
+            List of per-host URL deques, one entry per download worker to start
+        """
+        host_queues = {}
+        for url in video_urls:
+            host_queues.setdefault(urlparse(url).netloc.lower(), deque()).append(url)
+        
+        jobs = []
+        for slot in range(self.max_downloads_per_host):
+            for host_urls in host_queues.values():
+                if slot < len(host_urls):
+                    jobs.append(host_urls)
+        return jobs
+    
+    def _download_host_worker(self, host_urls, audio_queue, stop):
+        """
+        Download URLs from one host's work queue until it is empty
+        
+        Args:
+            host_urls: Deque of URLs from a single host, shared by that host's workers
+            audio_queue: Queue receiving (video_url, audio) pairs, with audio None on failure
+            stop: Event set when the pipeline is interrupted
+        """
+        while not stop.is_set():
+            try:
+                video_url = host_urls.popleft()
+            except IndexError:
+                return
+            self._download_worker(video_url, audio_queue, stop)
+    
+    def _download_worker(self, video_url, audio_queue, stop):
+        """
+        Download one video and hand its audio to the transcription threads
+        
+        Args:
+            video_url: URL of the video to download
+            audio_queue: Queue receiving (video_url, audio) pairs, with audio None on failure
+            stop: Event set when the pipeline is interrupted
+        """
+        if stop.is_set():
+            return
+        
+        audio = None
+        try:
+            audio = self.download_and_extract_audio(video_url)
+        except Exception as e:
+            logger.error(f"Error processing download result for {video_url}: {str(e)}")
         finally:
-            # Clean up the audio file
+            # Wait for room in the bounded queue, but give up once the consumers are gone
+            while not stop.is_set():
+                try:
+                    audio_queue.put((video_url, audio), timeout=QUEUE_POLL_SECONDS)
+                    break
+                except queue.Full:
+                    pass
+    
+    def _transcribe_worker(self, audio_queue, model_name, stop):
+        """
+        Transcribe downloaded audio from the queue until the end-of-stream marker (None) arrives
+        
+        Args:
+            audio_queue: Queue of (video_url, audio) pairs filled by _download_worker
+            model_name: Whisper model name, recorded with cached results
+            stop: Event set when the pipeline is interrupted
+        """
+        while not stop.is_set():
+            try:
+                item = audio_queue.get(timeout=QUEUE_POLL_SECONDS)
+            except queue.Empty:
+                continue
+            if item is None:
+                break
+            
+            video_url, audio = item
             try:
-                if os.path.exists(audio_file):
-                    os.remove(audio_file)
-                    logger.info(f"Removed temporary audio file: {audio_file}")
+                if audio is None:
+                    with self._results_lock:
+                        self.errors.append({
+                            "url": video_url,
+                            "error_message": "Failed to download or extract audio"
+                        })
+                    continue
+                
+                result = self.transcribe_audio(audio, video_url)
+                if result['status'] == 'error':
+                    with self._results_lock:
+                        self.errors.append({
+                            "url": result['url'],
+                            "error_message": result.get('error_message', 'Unknown transcription error')
+                        })
+                else:
+                    self._save_cached_result(result, model_name)
+                
+                with self._results_lock:
+                    self.results.append(result)
+                    # Lay out this transcript's flowables while the others are still running
+                    self._add_to_report(result)
             except Exception as e:
-                logger.warning(f"Failed to delete temporary audio file {audio_file}: {str(e)}")
+                logger.error(f"Error processing transcription result for {video_url}: {str(e)}")
+    
+    def _postprocess(self, text):
+        """
+        Collapse looped n-grams from a raw transcript
+        
+        Args:
+            text: Transcript text as produced by Whisper, with boilerplate segments already removed
+            
+        Returns:
+            Cleaned transcript text
+        """
+        tokens = text.split()
+        
+        # Check longer n-grams first so a looped phrase is not split into shorter repeats
+        for n in REPEAT_NGRAM_SIZES:
+            tokens = self._collapse_repeats(tokens, n)
+        
+        return " ".join(tokens)
+    
+    def _collapse_repeats(self, tokens, n):
+        """Replace runs of more than MAX_NGRAM_REPEATS identical n-grams with a single copy"""
+        collapsed = []
+        i = 0
+        while i < len(tokens):
+            ngram = tokens[i:i + n]
+            repeats = 1
+            while len(ngram) == n and tokens[i + repeats * n:i + (repeats + 1) * n] == ngram:
+                repeats += 1
+            
+            if repeats > MAX_NGRAM_REPEATS:
+                collapsed.extend(ngram)
+                i += repeats * n
+            else:
+                collapsed.append(tokens[i])
+                i += 1
+        
+        return collapsed
+    
+    def _cache_path(self, video_url):
+        """Path of the cached result for a video URL"""
+        return self.cache_dir / f"{hashlib.sha256(video_url.encode()).hexdigest()}.json"
+    
+    def _load_cached_result(self, video_url, model_name):
+        """
+        Load a previously cached transcription result
+        
+        Args:
+            video_url: URL of the video
+            model_name: Whisper model the result must have been produced with
+            
+        Returns:
+            Cached result dictionary or None if there is no usable cache entry
+        """
+        try:
+            with open(self._cache_path(video_url), 'r') as f:
+                cached = json.load(f)
+            
+            # The cache lives in a user-editable directory, so check the entry's shape
+            if not isinstance(cached, dict):
+                raise ValueError("entry is not a JSON object")
+            missing = {"url", "status", "transcript", "model"} - cached.keys()
+            if missing:
+                raise ValueError(f"entry is missing {', '.join(sorted(missing))}")
+            if cached["status"] not in ("success", "empty") or not isinstance(cached["transcript"], str):
+                raise ValueError("entry has an invalid status or transcript")
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry for {video_url}: {str(e)}")
+            return None
+        
+        if cached["model"] != model_name or cached["url"] != video_url:
+            return None
+        
+        logger.info(f"Using cached transcript for {video_url}")
+        return {
+            "url": cached["url"],
+            "status": cached["status"],
+            "transcript": cached["transcript"]
+        }
+    
+    def _save_cached_result(self, result, model_name):
+        """
+        Atomically write a successful transcription result to the cache
+        
+        Args:
+            result: Result dictionary returned by transcribe_audio
+            model_name: Whisper model that produced the result
+        """
+        if result['status'] not in ('success', 'empty'):
+            return
+        
+        cache_path = self._cache_path(result['url'])
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=self.cache_dir, suffix='.tmp', delete=False) as f:
+                json.dump({**result, "model": model_name}, f)
+            os.replace(f.name, cache_path)
+        except Exception as e:
+            logger.warning(f"Failed to cache transcript for {result['url']}: {str(e)}")
+    
+    def _markup(self, text):
+        """Escape text for ReportLab's Paragraph markup, keeping line breaks"""
+        return escape(text).replace("\n", "<br/>")
+    
+    def _start_report(self):
+        """Reset the PDF flowables and add the report title"""
+        self._content = [
+            Paragraph("Video Transcription Report", self._title_style),
+            Paragraph(f"Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}", self._styles['Normal']),
+            Spacer(1, 24)
+        ]
+        self._report_count = 0
+    
+    def _add_to_report(self, result):
+        """
+        Append the flowables for one transcription result to the PDF report
+        
+        Args:
+            result: Result dictionary returned by transcribe_audio
+        """
+        self._report_count += 1
+        idx = self._report_count
+        
+        # Add page break after first page for better readability
+        if idx > 1:
+            self._content.append(PageBreak())
+        
+        # Video header
+        self._content.append(Paragraph(f"Video {idx}", self._title_style))
+        self._content.append(Paragraph(f"Source: {self._markup(result['url'])}", self._url_style))
+        self._content.append(Spacer(1, 12))
+        
+        # Transcript or error message
+        if result['status'] == 'success':
+            self._content.append(Paragraph(self._markup(result['transcript']), self._transcript_style))
+        elif result['status'] == 'empty':
+            self._content.append(Paragraph("No speech detected in this video.", self._error_style))
+        else:
+            self._content.append(Paragraph(f"Error: Failed to transcribe this video.", self._error_style))
+            self._content.append(Paragraph(f"Details: {self._markup(result.get('error_message', 'Unknown error'))}", self._error_style))
     
     def generate_pdf(self, output_path="transcripts.pdf"):
         """
         Generate PDF with all transcripts
         
+        Transcripts added with _add_to_report while the pipeline runs are reused;
+        otherwise the report is assembled from self.results here.
+        
         Args:
             output_path: Path to save the PDF file
         """
@@ -157,74 +674,25 @@ class VideoTranscriptionPipeline:
         
         # PDF setup
         doc = SimpleDocTemplate(output_path, pagesize=letter)
-        styles = getSampleStyleSheet()
-        
-        # Create custom styles
-        title_style = ParagraphStyle(
-            'TitleStyle',
-            parent=styles['Heading1'],
-            fontSize=18,
-            spaceAfter=12
-        )
         
-        url_style = ParagraphStyle(
-            'URLStyle',
-            parent=styles['Heading2'],
-            fontSize=12,
-            textColor=colors.blue,
-            spaceAfter=6
-        )
+        # Rebuild the flowables if results were not streamed into the report as they completed
+        if self._report_count != len(self.results):
+            self._start_report()
+            for result in self.results:
+                self._add_to_report(result)
         
-        transcript_style = ParagraphStyle(
-            'TranscriptStyle',
-            parent=styles['Normal'],
-            fontSize=10,
-            spaceAfter=12
-        )
-        
-        error_style = ParagraphStyle(
-            'ErrorStyle',
-            parent=styles['Normal'],
-            textColor=colors.red,
-            fontSize=10
-        )
-        
-        # Content for the PDF
-        content = []
-        
-        # Add title
-        content.append(Paragraph("Video Transcription Report", title_style))
-        content.append(Paragraph(f"Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']))
-        content.append(Spacer(1, 24))
-        
-        # Add transcripts
-        for idx, result in enumerate(self.results, 1):
-            # Add page break after first page for better readability
-            if idx > 1:
-                content.append(PageBreak())
-            
-            # Video header
-            content.append(Paragraph(f"Video {idx}", title_style))
-            content.append(Paragraph(f"Source: {result['url']}", url_style))
-            content.append(Spacer(1, 12))
-            
-            # Transcript or error message
-            if result['status'] == 'success':
-                content.append(Paragraph(result['transcript'], transcript_style))
-            elif result['status'] == 'empty':
-                content.append(Paragraph("No speech detected in this video.", error_style))
-            else:
-                content.append(Paragraph(f"Error: Failed to transcribe this video.", error_style))
-                content.append(Paragraph(f"Details: {result.get('error_message', 'Unknown error')}", error_style))
+        content = list(self._content)
         
         # Add error summary if any
         if self.errors:
             content.append(PageBreak())
-            content.append(Paragraph("Error Summary", title_style))
+            content.append(Paragraph("Error Summary", self._title_style))
             content.append(Spacer(1, 12))
             
             for error in self.errors:
-                content.append(Paragraph(f"• {error['url']}: {error['error_message']}", error_style))
+                content.append(Paragraph(
+                    f"• {self._markup(error['url'])}: {self._markup(error['error_message'])}", self._error_style
+                ))
         
         # Build the PDF
         try:
@@ -234,76 +702,78 @@ class VideoTranscriptionPipeline:
             logger.error(f"Failed to generate PDF report: {str(e)}")
             raise
     
-    def process_videos(self, video_urls, output_pdf="transcripts.pdf", whisper_model_name="base"):
+    def process_videos(self, video_urls, output_pdf="transcripts.pdf", whisper_model_name=None):
         """
         Process a list of videos through the full pipeline
         
         Args:
             video_urls: List of video URLs to process
             output_pdf: Path to save the output PDF
-            whisper_model_name: Name of the Whisper model to use
+            whisper_model_name: Name of the Whisper model to use (distil-large-v3 on GPU, base on CPU by default)
         """
         start_time = time.time()
+        whisper_model_name = whisper_model_name or self._default_model_name()
         logger.info(f"Starting pipeline for {len(video_urls)} videos")
         
         # Clear previous results
         self.results = []
         self.errors = []
+        self._start_report()
         
         # Create temporary directory
         with tempfile.TemporaryDirectory() as temp_dir:
             self.temp_dir = temp_dir
+            self._temp = Path(temp_dir)
             logger.info(f"Created temporary directory: {temp_dir}")
             
-            # Initialize Whisper model
-            self.initialize(model_name=whisper_model_name)
+            # Reuse transcripts cached by earlier runs
+            pending_urls = []
+            for url in video_urls:
+                cached = self._load_cached_result(url, whisper_model_name)
+                if cached:
+                    self.results.append(cached)
+                    self._add_to_report(cached)
+                else:
+                    pending_urls.append(url)
             
-            # Download and extract audio in parallel
-            download_futures = []
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrent_downloads) as download_executor:
-                # Submit download jobs
-                for url in video_urls:
-                    future = download_executor.submit(self.download_and_extract_audio, url)
-                    download_futures.append((future, url))
-                
-                # Process transcriptions as downloads complete
-                with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_concurrent_transcriptions) as transcribe_executor:
-                    transcribe_futures = []
+            # Initialize Whisper model (not needed when every transcript is cached)
+            if pending_urls:
+                self.initialize(model_name=whisper_model_name)
+            
+            # Downloads feed a queue that the transcription threads drain, so transcription
+            # starts on the first finished download (threads share the one loaded model;
+            # CTranslate2 releases the GIL during inference)
+            # The queue is bounded so downloaders wait instead of holding decoded audio
+            # for every pending URL in memory when transcription falls behind
+            audio_queue = queue.Queue(maxsize=2 * self.max_concurrent_transcriptions)
+            stop = threading.Event()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrent_transcriptions) as transcribe_executor:
+                try:
+                    consumers = [
+                        transcribe_executor.submit(self._transcribe_worker, audio_queue, whisper_model_name, stop)
+                        for _ in range(self.max_concurrent_transcriptions)
+                    ]
                     
-                    # As each download completes, submit it for transcription
-                    for future, url in download_futures:
-                        try:
-                            audio_file = future.result()
-                            if audio_file:
-                                # Submit for transcription
-                                transcribe_future = transcribe_executor.submit(self.transcribe_audio, audio_file, url)
-                                transcribe_futures.append(transcribe_future)
-                            else:
-                                # Log download failure
-                                self.errors.append({
-                                    "url": url,
-                                    "error_message": "Failed to download or extract audio"
-                                })
-                        except Exception as e:
-                            logger.error(f"Error processing download result for {url}: {str(e)}")
-                            self.errors.append({
-                                "url": url,
-                                "error_message": f"Download processing error: {str(e)}"
-                            })
+                    # Download and extract audio in parallel, with per-host work queues so each
+                    # host stays within max_downloads_per_host without parking pool threads
+                    download_executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrent_downloads)
+                    try:
+                        for host_urls in self._host_download_jobs(pending_urls):
+                            download_executor.submit(self._download_host_worker, host_urls, audio_queue, stop)
+                        download_executor.shutdown(wait=True)
+                    except BaseException:
+                        # Drop downloads that have not started yet
+                        download_executor.shutdown(wait=False, cancel_futures=True)
+                        raise
                     
-                    # Collect transcription results
-                    for future in concurrent.futures.as_completed(transcribe_futures):
-                        try:
-                            result = future.result()
-                            if result:
-                                if result['status'] == 'error':
-                                    self.errors.append({
-                                        "url": result['url'],
-                                        "error_message": result.get('error_message', 'Unknown transcription error')
-                                    })
-                                self.results.append(result)
-                        except Exception as e:
-                            logger.error(f"Error processing transcription result: {str(e)}")
+                    # All downloads are done; signal end-of-stream to every consumer
+                    for _ in consumers:
+                        audio_queue.put(None)
+                except BaseException:
+                    # Interrupted (e.g. Ctrl-C): stop every worker so none is left waiting on
+                    # a queue that nobody reads or fills any more
+                    stop.set()
+                    raise
             
             # Generate the PDF report
             self.generate_pdf(output_pdf)
@@ -340,7 +810,7 @@ if __name__ == "__main__":
     result = pipeline.process_videos(
         video_urls=video_urls,
         output_pdf="video_transcripts.pdf",
-        whisper_model_name="base"  # Options: tiny, base, small, medium, large
+        whisper_model_name="base"  # Options: tiny, base, small, medium, large, distil-large-v3, large-v3-turbo
     )
     
     print(f"Pipeline completed in {result['elapsed_time']:.2f} seconds")